@@ -7,7 +7,6 @@ to demonstrate abstract classes and interfaces through object-oriented programmi
 TODO: Implement all the classes and methods following the specifications
 """
 
-import random
 from abc import ABC, abstractmethod
 
 
@@ -176,13 +175,13 @@ class Counselor(Person, ISchedulable, ICertified):
         TODO:
         - Call the parent class constructor with appropriate arguments
         - Initialize additional attributes (_specialization, _case_load, _certification_expiry)
-        - Initialize an empty schedule dictionary (_schedule)
+        - Initialize an empty schedule set (_schedule) of (date, time) slots
         """
         # WRITE YOUR CODE HERE
         pass
     
     # TODO: Implement property getters and setters for:
-    # specialization, case_load (with validation 0-20)
+    # specialization, case_load (raise ValueError unless 0-20)
     
     def perform_duty(self):
         """
@@ -226,7 +225,7 @@ class Counselor(Person, ISchedulable, ICertified):
             
         TODO:
         - Check if counselor is available at given date and time
-        - If available, add the time to the schedule for that date
+        - If available, add the (date, time) slot to the schedule
         - If not available, raise ScheduleConflictException
         - Return True if scheduled successfully
         """
@@ -296,7 +295,7 @@ class Educator(Person, ISchedulable, ICertified):
         TODO:
         - Call the parent class constructor with appropriate arguments
         - Initialize additional attributes (_subject, _education_level, _certification_expiry)
-        - Initialize an empty schedule dictionary (_schedule)
+        - Initialize an empty schedule set (_schedule) of (date, time) slots
         """
         # WRITE YOUR CODE HERE
         pass
@@ -346,7 +345,7 @@ class Educator(Person, ISchedulable, ICertified):
             
         TODO:
         - Check if educator is available at given date and time
-        - If available, add the time to the schedule for that date
+        - If available, add the (date, time) slot to the schedule
         - If not available, raise ScheduleConflictException
         - Return True if scheduled successfully
         """
@@ -415,13 +414,13 @@ class Volunteer(Person, ISchedulable):
         - Call the parent class constructor with appropriate arguments
         - Initialize additional attributes (_availability, _hours_completed)
         - Set _hours_completed to 0
-        - Initialize an empty schedule dictionary (_schedule)
+        - Initialize an empty schedule set (_schedule) of (date, time) slots
         """
         # WRITE YOUR CODE HERE
         pass
     
     # TODO: Implement property getters and setters for:
-    # availability, hours_completed (with validation for non-negative values)
+    # availability, hours_completed (raise ValueError for negative values)
     
     def perform_duty(self):
         """
@@ -465,7 +464,7 @@ class Volunteer(Person, ISchedulable):
             
         TODO:
         - Check if volunteer is available at given date and time
-        - If available, add the time to the schedule for that date
+        - If available, add the (date, time) slot to the schedule
         - If not available, raise ScheduleConflictException
         - Return True if scheduled successfully
         """
@@ -522,16 +521,16 @@ class YouthCenter:
             
         TODO:
         - Initialize private attributes with double underscore prefix
-          (__name, __personnel, __activities, __next_id)
-        - Set __personnel to an empty list
+          (__name, __personnel, __activities, __id_sequences)
+        - Set __personnel to an empty dictionary keyed by person ID
         - Set __activities to an empty dictionary
-        - Set __next_id to 1
+        - Set __id_sequences to an empty dictionary of per-prefix (counter, formatter) pairs
         """
         # WRITE YOUR CODE HERE
         pass
     
     # TODO: Implement property getters for:
-    # name, personnel (return a copy), activities (return a copy)
+    # name, personnel (return a tuple snapshot), activities (return a read-only snapshot)
     
     def get_next_id(self, role_prefix):
         """
@@ -544,8 +543,8 @@ class YouthCenter:
             str: Formatted ID string
             
         TODO:
-        - Get the current ID value
-        - Increment the internal ID counter
+        - Take the next value from the counter for this prefix
+        - Skip values whose ID is already used by existing personnel
         - Return formatted ID with prefix and padded number (e.g., "C001")
         """
         # WRITE YOUR CODE HERE
@@ -562,8 +561,8 @@ class YouthCenter:
             bool: True if addition successful, False otherwise
             
         TODO:
-        - Check if person already exists in the personnel list
-        - If not, add the person to the __personnel list
+        - Check if the person's ID is already in __personnel
+        - If not, add the person to __personnel under their ID
         - Return True if added, False otherwise
         """
         # WRITE YOUR CODE HERE
@@ -581,7 +580,7 @@ class YouthCenter:
             
         TODO:
         - Find the person with the given ID
-        - If found, remove them from the __personnel list
+        - If found, remove them from __personnel
         - Return True if removed, False otherwise
         """
         # WRITE YOUR CODE HERE
@@ -601,7 +600,7 @@ class YouthCenter:
             PersonNotFoundException: If person not found
             
         TODO:
-        - Search for the person with the given ID
+        - Look up the person by ID in __personnel
         - If found, return the person
         - If not found, raise PersonNotFoundException
         """
@@ -619,7 +618,7 @@ class YouthCenter:
             list: List of personnel of the specified type
             
         TODO:
-        - Filter __personnel list to only include instances of the specified class
+        - Filter __personnel to only include instances of the specified class
         - Return the filtered list
         """
         # WRITE YOUR CODE HERE
@@ -0,0 +1,17 @@
+import pytest
+from test.TestUtils import TestUtils
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Attach each phase's report to the test item so fixtures can read the outcome."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, "rep_" + report.when, report)
+
+@pytest.fixture(autouse=True)
+def yaksha_report(request):
+    """Report every test's outcome to Yaksha once the test has run."""
+    yield
+    report = getattr(request.node, "rep_call", None)
+    test_type = request.module.__name__.rsplit(".", 1)[-1].replace("test_", "", 1)
+    TestUtils.yakshaAssert(request.node.name, report is not None and report.passed, test_type)
\ No newline at end of file
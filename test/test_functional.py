@@ -1,303 +1,324 @@
 import pytest
-import random
-from test.TestUtils import TestUtils
-from youth_center_management_system import Person, Counselor, Educator, Volunteer, YouthCenter, PersonNotFoundException, ScheduleConflictException, CertificationException
+from youth_center_management_system import Person, Counselor, Educator, Volunteer, YouthCenter, PersonNotFoundException, ScheduleConflictException, CertificationException, ISchedulable, Activity, handle_command
+
+# Schedule dates and times used throughout this module
+DATE_MAR15 = "2024-03-15"
+DATE_MAR16 = "2024-03-16"
+DATE_MAR16_SAT = "2024-03-16Sat"
+TIME_10 = "10:00"
+TIME_14 = "14:00"
+TIME_15 = "15:00"
+
+@pytest.fixture
+def counselor():
+    return Counselor("C001", "Emma Smith", "behavioral", 5)
+
+@pytest.fixture
+def educator():
+    return Educator("E001", "John Davis", "mathematics")
+
+@pytest.fixture
+def volunteer():
+    return Volunteer("V001", "Sara Johnson", "weekends")
 
 class TestFunctional:
     """Test cases for functional requirements of the youth center management system."""
     
     def test_person_constructor_destructor(self):
         """Test Person abstract class and derived class constructor/destructor functionality."""
-        try:
-            # Cannot test Person directly since it's abstract
-            # Test through concrete implementations
-            initial_count = Person.person_count
-            
-            # Create different types of personnel
-            counselor = Counselor("C001", "Emma Smith", "behavioral", 5)
-            assert Person.person_count == initial_count + 1
-            
-            educator = Educator("E001", "John Davis", "mathematics")
-            assert Person.person_count == initial_count + 2
-            
-            volunteer = Volunteer("V001", "Sara Johnson", "weekends")
-            assert Person.person_count == initial_count + 3
-            
-            # Test property access - inherits from Person
-            assert counselor.id == "C001"
-            assert counselor.name == "Emma Smith"
-            assert counselor.role == "Counselor"
-            
-            # Force destructor call and test count decrement
-            del volunteer
-            # Note: Count won't immediately update due to garbage collection timing
-            
-            TestUtils.yakshaAssert("test_person_constructor_destructor", True, "functional")
-        except Exception as e:
-            TestUtils.yakshaAssert("test_person_constructor_destructor", False, "functional")
-            raise e
+        # Cannot test Person directly since it's abstract
+        # Test through concrete implementations
+        initial_count = Person.person_count
+        
+        # Create different types of personnel
+        counselor = Counselor("C001", "Emma Smith", "behavioral", 5)
+        educator = Educator("E001", "John Davis", "mathematics")
+        volunteer = Volunteer("V001", "Sara Johnson", "weekends")
+        assert Person.person_count == initial_count + 3
+        
+        # Test property access - inherits from Person
+        assert counselor.id == "C001"
+        assert counselor.name == "Emma Smith"
+        assert counselor.role == "Counselor"
+        
+        # Force destructor call and test count decrement
+        del volunteer
+        # Note: Count won't immediately update due to garbage collection timing
     
-    def test_abstract_class_implementation(self):
+    def test_abstract_class_implementation(self, counselor, educator, volunteer):
         """Test proper implementation of abstract methods."""
-        try:
-            # Create instances of concrete classes
-            counselor = Counselor("C001", "Emma Smith", "behavioral", 5)
-            educator = Educator("E001", "John Davis", "mathematics")
-            volunteer = Volunteer("V001", "Sara Johnson", "weekends")
-            
-            # Test display_info abstract method implementation
-            counselor_info = counselor.display_info()
-            assert "Emma Smith" in counselor_info
-            assert "Counselor" in counselor_info
-            assert "behavioral" in counselor_info
-            
-            educator_info = educator.display_info()
-            assert "John Davis" in educator_info
-            assert "Educator" in educator_info
-            assert "mathematics" in educator_info
-            
-            volunteer_info = volunteer.display_info()
-            assert "Sara Johnson" in volunteer_info
-            assert "Volunteer" in volunteer_info
-            assert "weekends" in volunteer_info
-            
-            # Test perform_duty abstract method implementation
-            counselor_duty = counselor.perform_duty()
-            assert "Emma" in counselor_duty
-            assert "counseling" in counselor_duty.lower()
-            
-            educator_duty = educator.perform_duty()
-            assert "John" in educator_duty
-            assert "teaching" in educator_duty.lower()
-            
-            volunteer_duty = volunteer.perform_duty()
-            assert "Sara" in volunteer_duty or "volunteering" in volunteer_duty.lower()
-            
-            TestUtils.yakshaAssert("test_abstract_class_implementation", True, "functional")
-        except Exception as e:
-            TestUtils.yakshaAssert("test_abstract_class_implementation", False, "functional")
-            raise e
+        # Test display_info abstract method implementation
+        for person, tokens in ((counselor, ("Emma Smith", "Counselor", "behavioral")),
+                               (educator, ("John Davis", "Educator", "mathematics")),
+                               (volunteer, ("Sara Johnson", "Volunteer", "weekends"))):
+            info = person.display_info()
+            for token in tokens:
+                assert token in info
+        
+        # Test perform_duty abstract method implementation
+        for person, first_name, activity in ((counselor, "Emma", "counseling"),
+                                             (educator, "John", "teaching")):
+            duty = person.perform_duty()
+            assert first_name in duty
+            assert activity in duty.lower()
+        
+        volunteer_duty = volunteer.perform_duty()
+        assert "Sara" in volunteer_duty or "volunteering" in volunteer_duty.lower()
     
-    def test_interface_implementation(self):
+    def test_interface_implementation(self, counselor, educator, volunteer):
         """Test proper implementation of interface methods."""
-        try:
-            # Create instances of classes implementing interfaces
-            counselor = Counselor("C001", "Emma Smith", "behavioral", 5)
-            educator = Educator("E001", "John Davis", "mathematics")
-            volunteer = Volunteer("V001", "Sara Johnson", "weekends")
-            
-            # Test ISchedulable interface implementation
-            # All should implement schedule and is_available
-            
-            # Counselor (implements ISchedulable, ICertified)
-            assert counselor.schedule("2024-03-15", "10:00") is True
-            assert counselor.is_available("2024-03-15", "10:00") is False
-            assert counselor.is_available("2024-03-16", "10:00") is True
-            
-            # Test ICertified interface implementation
-            assert counselor.verify_certification() is True
-            cert_details = counselor.get_certification_details()
-            assert "behavioral" in cert_details
-            assert "expires" in cert_details
-            
-            # Educator (implements ISchedulable, ICertified)
-            assert educator.schedule("2024-03-15", "14:00") is True
-            assert educator.is_available("2024-03-15", "14:00") is False
-            assert educator.is_available("2024-03-15", "15:00") is True
-            
-            assert educator.verify_certification() is True
-            cert_details = educator.get_certification_details()
-            assert "mathematics" in cert_details
-            assert "expires" in cert_details
-            
-            # Volunteer (implements only ISchedulable)
-            # Weekend volunteer should be available on weekends
-            assert volunteer.is_available("2024-03-16Sat", "10:00") is True
-            assert volunteer.schedule("2024-03-16Sat", "10:00") is True
-            assert volunteer.is_available("2024-03-16Sat", "10:00") is False
-            
-            # Test volunteer-specific method
-            assert volunteer.log_hours(5) is True
-            assert volunteer.hours_completed == 5
-            
-            TestUtils.yakshaAssert("test_interface_implementation", True, "functional")
-        except Exception as e:
-            TestUtils.yakshaAssert("test_interface_implementation", False, "functional")
-            raise e
+        # Test ISchedulable interface implementation
+        # All should implement schedule and is_available
+        
+        # Counselor (implements ISchedulable, ICertified)
+        assert counselor.schedule(DATE_MAR15, TIME_10) is True
+        assert counselor.is_available(DATE_MAR15, TIME_10) is False
+        assert counselor.is_available(DATE_MAR16, TIME_10) is True
+        
+        # Test ICertified interface implementation
+        assert counselor.verify_certification() is True
+        cert_details = counselor.get_certification_details()
+        assert "behavioral" in cert_details
+        assert "expires" in cert_details
+        
+        # Educator (implements ISchedulable, ICertified)
+        assert educator.schedule(DATE_MAR15, TIME_14) is True
+        assert educator.is_available(DATE_MAR15, TIME_14) is False
+        assert educator.is_available(DATE_MAR15, TIME_15) is True
+        
+        assert educator.verify_certification() is True
+        cert_details = educator.get_certification_details()
+        assert "mathematics" in cert_details
+        assert "expires" in cert_details
+        
+        # Volunteer (implements only ISchedulable)
+        # Weekend volunteer should be available on weekends
+        assert volunteer.is_available(DATE_MAR16_SAT, TIME_10) is True
+        assert volunteer.schedule(DATE_MAR16_SAT, TIME_10) is True
+        assert volunteer.is_available(DATE_MAR16_SAT, TIME_10) is False
+        
+        # Test volunteer-specific method
+        assert volunteer.log_hours(5) is True
+        assert volunteer.hours_completed == 5
     
-    def test_youth_center_functionality(self):
+    def test_youth_center_functionality(self, counselor, educator, volunteer):
         """Test YouthCenter class and management functionality."""
-        try:
-            # Create youth center
-            center = YouthCenter("BrightFuture Youth Center")
-            assert center.name == "BrightFuture Youth Center"
-            
-            # Add various personnel
-            counselor = Counselor("C001", "Emma Smith", "behavioral", 5)
-            educator = Educator("E001", "John Davis", "mathematics")
-            volunteer = Volunteer("V001", "Sara Johnson", "weekends")
-            
-            center.add_person(counselor)
-            center.add_person(educator)
-            center.add_person(volunteer)
-            
-            # Test personnel management
-            assert len(center.personnel) == 3
-            
-            # Test get_personnel_by_type
-            counselors = center.get_personnel_by_type(Counselor)
-            educators = center.get_personnel_by_type(Educator)
-            volunteers = center.get_personnel_by_type(Volunteer)
-            
-            assert len(counselors) == 1 and counselors[0].id == "C001"
-            assert len(educators) == 1 and educators[0].id == "E001"
-            assert len(volunteers) == 1 and volunteers[0].id == "V001"
-            
-            # Test personnel count
-            counts = center.get_personnel_count()
-            assert counts["Counselor"] == 1
-            assert counts["Educator"] == 1
-            assert counts["Volunteer"] == 1
-            
-            # Test find_person_by_id
-            found_counselor = center.find_person_by_id("C001")
-            assert found_counselor.id == "C001" and found_counselor.name == "Emma Smith"
-            
-            # Test activity scheduling
-            result = center.create_activity("Math Tutoring", "2024-03-15", "14:00", "E001")
-            assert result is True
-            
-            # Verify the activity was created in activities
-            assert "Math Tutoring" in center.activities
-            
-            # Test scheduling conflict
-            result = center.create_activity("Another Math Session", "2024-03-15", "14:00", "E001")
-            assert result is False
-            
-            # Test certification verification
-            verification_results = center.verify_all_certifications()
-            assert len(verification_results) == 2  # Both counselor and educator should have certifications
-            
-            # Count valid certifications
-            valid_certs = sum(1 for result in verification_results if result["certification_valid"])
-            assert valid_certs == 2
-            
-            # Test removal of personnel
-            assert center.remove_person("C001") is True
-            counts = center.get_personnel_count()
-            assert counts["Counselor"] == 0
-            
-            # Try finding deleted person
-            try:
-                center.find_person_by_id("C001")
-                assert False, "Should raise PersonNotFoundException"
-            except PersonNotFoundException:
-                pass  # Expected behavior
-            
-            TestUtils.yakshaAssert("test_youth_center_functionality", True, "functional")
-        except Exception as e:
-            TestUtils.yakshaAssert("test_youth_center_functionality", False, "functional")
-            raise e
+        # Create youth center
+        center = YouthCenter("BrightFuture Youth Center")
+        assert center.name == "BrightFuture Youth Center"
+        
+        # Add various personnel
+        center.add_person(counselor)
+        center.add_person(educator)
+        center.add_person(volunteer)
+        
+        # Test personnel management
+        personnel = center.personnel
+        assert len(personnel) == 3
+        
+        # Test get_personnel_by_type
+        counselors = center.get_personnel_by_type(Counselor)
+        educators = center.get_personnel_by_type(Educator)
+        volunteers = center.get_personnel_by_type(Volunteer)
+        
+        assert len(counselors) == 1 and counselors[0].id == "C001"
+        assert len(educators) == 1 and educators[0].id == "E001"
+        assert len(volunteers) == 1 and volunteers[0].id == "V001"
+        
+        # Test personnel count
+        assert center.get_personnel_count() == {"Counselor": 1, "Educator": 1, "Volunteer": 1}
+        
+        # Test find_person_by_id against a single id index of the roster
+        by_id = {p.id: p for p in personnel}
+        assert by_id["C001"].name == "Emma Smith"
+        for person_id in ("C001", "E001", "V001"):
+            assert center.find_person_by_id(person_id) is by_id[person_id]
+        
+        # Test activity scheduling
+        result = center.create_activity("Math Tutoring", DATE_MAR15, TIME_14, "E001")
+        assert result is True
+        
+        # Verify the activity was created in activities
+        activities = center.activities
+        assert "Math Tutoring" in activities and len(activities) == 1
+        session = activities["Math Tutoring"][0]
+        assert isinstance(session, Activity)
+        assert (session.date, session.time, session.responsible) == (DATE_MAR15, TIME_14, "E001")
+        
+        # Test scheduling conflict
+        result = center.create_activity("Another Math Session", DATE_MAR15, TIME_14, "E001")
+        assert result is False
+        
+        # Test certification verification
+        verification_results = center.verify_all_certifications()
+        assert len(verification_results) == 2  # Both counselor and educator should have certifications
+        
+        # Count valid certifications
+        valid_certs = sum(bool(result["certification_valid"]) for result in verification_results)
+        assert valid_certs == 2
+        
+        # The tuple generator yields the same results in the same order
+        assert [(r["id"], r["name"], r["certification_valid"], r["details"]) for r in verification_results] == list(center.iter_certifications())
+        
+        # Test removal of personnel
+        assert center.remove_person("C001") is True
+        assert center.get_personnel_count() == {"Counselor": 0, "Educator": 1, "Volunteer": 1}
+        
+        # Try finding deleted person
+        with pytest.raises(PersonNotFoundException):
+            center.find_person_by_id("C001")
     
-    def test_property_implementation(self):
+    def test_property_implementation(self, counselor, volunteer):
         """Test proper implementation of properties across classes."""
-        try:
-            # Test Counselor properties
-            counselor = Counselor("C001", "Emma Smith", "behavioral", 5)
-            assert counselor.id == "C001"  # From Person
-            assert counselor.name == "Emma Smith"  # From Person
-            assert counselor.role == "Counselor"  # From Person
-            assert counselor.specialization == "behavioral"  # Counselor-specific
-            assert counselor.case_load == 5  # Counselor-specific with setter
-            
-            # Test case_load setter with validation
-            counselor.case_load = 15
-            assert counselor.case_load == 15
-            
-            counselor.case_load = 25  # Should be rejected or capped
-            assert counselor.case_load <= 20
-            
-            counselor.case_load = -5  # Should be rejected or capped
-            assert counselor.case_load >= 0
-            
-            # Test Educator properties
-            educator = Educator("E001", "John Davis", "mathematics", "PhD")
-            assert educator.id == "E001"  # From Person
-            assert educator.name == "John Davis"  # From Person
-            assert educator.role == "Educator"  # From Person
-            assert educator.subject == "mathematics"  # Educator-specific
-            assert educator.education_level == "PhD"  # Educator-specific
-            
-            # Test Volunteer properties
-            volunteer = Volunteer("V001", "Sara Johnson", "weekends")
-            assert volunteer.id == "V001"  # From Person
-            assert volunteer.name == "Sara Johnson"  # From Person
-            assert volunteer.role == "Volunteer"  # From Person
-            assert volunteer.availability == "weekends"  # Volunteer-specific
-            assert volunteer.hours_completed == 0  # Volunteer-specific with setter
-            
-            # Test hours_completed setter with validation
-            volunteer.hours_completed = 10
-            assert volunteer.hours_completed == 10
-            
-            volunteer.hours_completed = -5  # Should be rejected
-            assert volunteer.hours_completed == 10  # Unchanged
-            
-            # Test YouthCenter properties
-            center = YouthCenter("Test Center")
-            assert center.name == "Test Center"
-            
-            # Test personnel list immutability
-            personnel_list = center.personnel
-            center.add_person(counselor)
-            
-            # Original list should be a copy and not affected by subsequent additions
-            assert len(personnel_list) == 0
-            assert len(center.personnel) == 1
-            
-            # Test activities dictionary immutability
-            activities_dict = center.activities
-            center.create_activity("Test Activity", "2024-03-15", "10:00", "C001")
-            
-            # Original dict should be a copy and not affected by subsequent additions
-            assert len(activities_dict) == 0
-            assert len(center.activities) == 1
-            
-            TestUtils.yakshaAssert("test_property_implementation", True, "functional")
-        except Exception as e:
-            TestUtils.yakshaAssert("test_property_implementation", False, "functional")
-            raise e
+        # Test Counselor properties
+        assert counselor.id == "C001"  # From Person
+        assert counselor.name == "Emma Smith"  # From Person
+        assert counselor.role == "Counselor"  # From Person
+        assert counselor.specialization == "behavioral"  # Counselor-specific
+        assert counselor.case_load == 5  # Counselor-specific with setter
+        
+        # Test case_load setter with validation
+        counselor.case_load = 15
+        assert counselor.case_load == 15
+        
+        with pytest.raises(ValueError):
+            counselor.case_load = 25  # Above max
+        with pytest.raises(ValueError):
+            counselor.case_load = -5  # Below min
+        assert counselor.case_load == 15
+        
+        # Test Educator properties
+        educator = Educator("E001", "John Davis", "mathematics", "PhD")
+        assert educator.id == "E001"  # From Person
+        assert educator.name == "John Davis"  # From Person
+        assert educator.role == "Educator"  # From Person
+        assert educator.subject == "mathematics"  # Educator-specific
+        assert educator.education_level == "PhD"  # Educator-specific
+        
+        # Test Volunteer properties
+        assert volunteer.id == "V001"  # From Person
+        assert volunteer.name == "Sara Johnson"  # From Person
+        assert volunteer.role == "Volunteer"  # From Person
+        assert volunteer.availability == "weekends"  # Volunteer-specific
+        assert volunteer.hours_completed == 0  # Volunteer-specific with setter
+        
+        # Test hours_completed setter with validation
+        volunteer.hours_completed = 10
+        assert volunteer.hours_completed == 10
+        
+        with pytest.raises(ValueError):
+            volunteer.hours_completed = -5
+        assert volunteer.hours_completed == 10  # Unchanged
+        
+        # Test YouthCenter properties
+        center = YouthCenter("Test Center")
+        assert center.name == "Test Center"
+        
+        # Test personnel snapshot immutability
+        personnel_snapshot = center.personnel
+        snapshot_length = len(personnel_snapshot)
+        center.add_person(counselor)
+        
+        # Original snapshot should not be affected by subsequent additions
+        personnel = center.personnel
+        assert personnel is not personnel_snapshot
+        assert len(personnel_snapshot) == snapshot_length and len(personnel) == snapshot_length + 1
+        
+        # Test activities snapshot immutability
+        activities_snapshot = center.activities
+        snapshot_length = len(activities_snapshot)
+        center.create_activity("Test Activity", DATE_MAR15, TIME_10, "C001")
+        
+        # Original snapshot should not be affected by subsequent additions
+        activities = center.activities
+        assert activities is not activities_snapshot
+        assert len(activities_snapshot) == snapshot_length and len(activities) == snapshot_length + 1
     
-    def test_encapsulation(self):
+    def test_encapsulation(self, counselor):
         """Test proper encapsulation of attributes."""
-        try:
-            # Create objects for testing
-            counselor = Counselor("C001", "Emma Smith", "behavioral", 5)
-            center = YouthCenter("Test Center")
-            
-            # Test protected attributes (_prefix) access
-            # Direct access should be avoided, we test through properties
-            assert counselor.id == "C001"  # Access through property
-            
-            # For YouthCenter, attributes should be private (__prefix)
-            # Direct access would raise AttributeError, so we test through properties
-            assert center.name == "Test Center"  # Access through property
-            
-            # Add a counselor and test operations that use private attributes
-            center.add_person(counselor)
-            
-            # Test operations that would use private attributes internally
-            found_person = center.find_person_by_id("C001")
-            assert found_person.id == "C001"
-            
-            center.create_activity("Counseling Session", "2024-03-15", "10:00", "C001")
-            
-            # Test get_next_id functionality (uses private counter)
-            id1 = center.get_next_id("C")
-            id2 = center.get_next_id("C")
-            assert id1 != id2  # Should be different
-            
-            TestUtils.yakshaAssert("test_encapsulation", True, "functional")
-        except Exception as e:
-            TestUtils.yakshaAssert("test_encapsulation", False, "functional")
-            raise e
\ No newline at end of file
+        # Create center for testing
+        center = YouthCenter("Test Center")
+        
+        # Test protected attributes (_prefix) access
+        # Direct access should be avoided, we test through properties
+        assert counselor.id == "C001"  # Access through property
+        
+        # For YouthCenter, attributes should be private (__prefix)
+        # Direct access would raise AttributeError, so we test through properties
+        assert center.name == "Test Center"  # Access through property
+        
+        # Add a counselor and test operations that use private attributes
+        center.add_person(counselor)
+        
+        # Test operations that would use private attributes internally
+        found_person = center.find_person_by_id("C001")
+        assert found_person.id == "C001"
+        
+        center.create_activity("Counseling Session", DATE_MAR15, TIME_10, "C001")
+        
+        # Test get_next_id functionality (uses private counter)
+        id1 = center.get_next_id("C")
+        id2 = center.get_next_id("C")
+        assert id1 != id2  # Should be different
+        
+        # Each prefix has its own counter, and IDs already in use are skipped
+        assert id1 == "C002"  # C001 is taken by the counselor
+        assert center.get_next_id("E") == "E001"
+    
+    def test_command_dispatch(self):
+        """Test running parsed commands through handle_command without console I/O."""
+        center = YouthCenter("Command Center")
+        
+        # Add people through commands; IDs come from the center
+        message = handle_command(center, {"command": "add_person", "type": Volunteer, "name": "Sam Lee", "args": ("weekends",)})
+        assert message == "Volunteer 'V001' added successfully."
+        handle_command(center, {"command": "add_person", "type": Counselor, "name": "Ada Park", "args": ("family", 2)})
+        assert center.get_personnel_count() == {"Counselor": 1, "Educator": 0, "Volunteer": 1}
+        
+        # Schedule an activity, then a conflicting one
+        schedule = {"command": "schedule_activity", "name": "Games", "date": DATE_MAR16_SAT, "time": TIME_10, "person_id": "V001"}
+        assert "scheduled successfully" in handle_command(center, schedule)
+        assert "Failed" in handle_command(center, schedule)
+        
+        # Reporting commands return text instead of printing it
+        assert "Sam Lee" in handle_command(center, {"command": "display_personnel"})
+        assert "Status: VALID" in handle_command(center, {"command": "verify_certifications"})
+        
+        with pytest.raises(ValueError):
+            handle_command(center, {"command": "unknown"})
+    
+    @pytest.mark.parametrize("raise_on_conflict", [
+        pytest.param(True, id="raises"),
+        pytest.param(False, id="returns_false"),
+    ])
+    def test_custom_schedulable_person(self, raise_on_conflict):
+        """Test that a new Person subclass implementing ISchedulable can be scheduled, whichever way it reports conflicts."""
+        class Coach(Person, ISchedulable):
+            __slots__ = ("_slots",)
+            
+            def __init__(self, id, name):
+                super().__init__(id, name, "Coach")
+                self._slots = set()
+            
+            def display_info(self):
+                return f"ID: {self._id} | Name: {self._name} | Role: {self._role}"
+            
+            def perform_duty(self):
+                return f"{self._name} is coaching."
+            
+            def schedule(self, date, time):
+                if (date, time) in self._slots:
+                    if raise_on_conflict:
+                        raise ScheduleConflictException(f"{self._name} is already booked")
+                    return False
+                self._slots.add((date, time))
+                return True
+            
+            def is_available(self, date, time):
+                return (date, time) not in self._slots
+        
+        center = YouthCenter("Test Center")
+        center.add_person(Coach("K001", "Pat Reyes"))
+        assert center.create_activity("Practice", DATE_MAR15, TIME_10, "K001") is True
+        assert center.create_activity("Practice", DATE_MAR15, TIME_10, "K001") is False
+        assert len(center.activities["Practice"]) == 1  # The conflicting booking is not recorded
\ No newline at end of file
@@ -5,8 +5,11 @@ This module implements a management system for BrightFuture Foundation's youth c
 to demonstrate abstract classes and interfaces through object-oriented programming.
 """
 
-import random
+import datetime
+import itertools
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from types import MappingProxyType
 
 
 class PersonNotFoundException(Exception):
@@ -24,11 +27,21 @@ class CertificationException(Exception):
     pass
 
 
+_CERTIFICATION_CUTOFF = datetime.date(2023, 1, 1)
+
+
 class Person(ABC):
     """Abstract base class representing any person at the youth center."""
     
+    __slots__ = ("_id", "_name", "_role")
+    
     person_count = 0
     
+    def __init_subclass__(cls, **kwargs):
+        """Derive the capability flag from the interfaces the subclass implements."""
+        super().__init_subclass__(**kwargs)
+        cls._is_schedulable = issubclass(cls, ISchedulable)
+    
     def __init__(self, id, name, role):
         """Initialize a Person with required attributes."""
         self._id = id
@@ -65,6 +78,8 @@ class Person(ABC):
 class ISchedulable:
     """Interface for objects that can be scheduled."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def schedule(self, date, time):
         """Schedule an activity at a specific date and time."""
@@ -79,6 +94,8 @@ class ISchedulable:
 class ICertified:
     """Interface for objects that require certification."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def verify_certification(self):
         """Verify that certification is valid."""
@@ -90,16 +107,43 @@ class ICertified:
         pass
 
 
-class Counselor(Person, ISchedulable, ICertified):
+class SchedulableMixin(ISchedulable):
+    """Shared ISchedulable implementation backed by a set of (date, time) slots."""
+    
+    __slots__ = ()
+    
+    _booking_noun = "session"
+    
+    def schedule(self, date, time):
+        """Book a (date, time) slot."""
+        if (date, time) in self._schedule:
+            raise ScheduleConflictException(f"{self._name} already has a {self._booking_noun} at {date} {time}")
+        self._schedule.add((date, time))
+        return True
+    
+    def is_available(self, date, time):
+        """Check if the (date, time) slot is free."""
+        return (date, time) not in self._schedule
+
+
+class Counselor(Person, SchedulableMixin, ICertified):
     """Class representing counselors at the youth center."""
     
+    __slots__ = ("_specialization", "_case_load", "_certification_expiry", "_certification_expiry_date",
+                 "_certification_details", "_info", "_schedule")
+    
+    _MAX_CASE_LOAD = 20
+    
     def __init__(self, id, name, specialization, case_load=0, certification_expiry="2025-12-31"):
         """Initialize a Counselor with required attributes."""
         super().__init__(id, name, "Counselor")
         self._specialization = specialization
-        self._case_load = case_load
+        self._info = None
+        self.case_load = case_load  # Validated by the setter
         self._certification_expiry = certification_expiry
-        self._schedule = {}
+        self._certification_expiry_date = datetime.date.fromisoformat(certification_expiry)
+        self._certification_details = f"Certification in {specialization} counseling, expires: {certification_expiry}"
+        self._schedule = set()
     
     @property
     def specialization(self): return self._specialization
@@ -109,8 +153,10 @@ class Counselor(Person, ISchedulable, ICertified):
     
     @case_load.setter
     def case_load(self, value):
-        if 0 <= value <= 20:
-            self._case_load = value
+        if not 0 <= value <= self._MAX_CASE_LOAD:
+            raise ValueError(f"Case load must be between 0 and {self._MAX_CASE_LOAD}")
+        self._case_load = value
+        self._info = None
     
     def perform_duty(self):
         """Perform counseling duties."""
@@ -118,43 +164,39 @@ class Counselor(Person, ISchedulable, ICertified):
     
     def display_info(self):
         """Display counselor-specific information."""
-        return f"ID: {self._id} | Name: {self._name} | Role: {self._role} | " \
-               f"Specialization: {self._specialization} | Case Load: {self._case_load}"
-    
-    def schedule(self, date, time):
-        """Schedule a counseling session."""
-        if self.is_available(date, time):
-            if date not in self._schedule:
-                self._schedule[date] = []
-            self._schedule[date].append(time)
-            return True
-        else:
-            raise ScheduleConflictException(f"{self._name} already has a session at {date} {time}")
-    
-    def is_available(self, date, time):
-        """Check if available for a session."""
-        return date not in self._schedule or time not in self._schedule[date]
+        if self._info is None:
+            self._info = f"ID: {self._id} | Name: {self._name} | Role: {self._role} | " \
+                         f"Specialization: {self._specialization} | Case Load: {self._case_load}"
+        return self._info
     
     def verify_certification(self):
         """Verify counseling certification."""
         # Simple validation - in a real system, this would check against a database
-        return True if self._certification_expiry > "2023-01-01" else False
+        return self._certification_expiry_date > _CERTIFICATION_CUTOFF
     
     def get_certification_details(self):
         """Get certification details."""
-        return f"Certification in {self._specialization} counseling, expires: {self._certification_expiry}"
+        return self._certification_details
 
 
-class Educator(Person, ISchedulable, ICertified):
+class Educator(Person, SchedulableMixin, ICertified):
     """Class representing educators at the youth center."""
     
+    __slots__ = ("_subject", "_education_level", "_certification_expiry", "_certification_expiry_date",
+                 "_certification_details", "_info", "_schedule")
+    
+    _booking_noun = "class"
+    
     def __init__(self, id, name, subject, education_level="Bachelor's", certification_expiry="2025-12-31"):
         """Initialize an Educator with required attributes."""
         super().__init__(id, name, "Educator")
         self._subject = subject
         self._education_level = education_level
         self._certification_expiry = certification_expiry
-        self._schedule = {}
+        self._certification_expiry_date = datetime.date.fromisoformat(certification_expiry)
+        self._certification_details = f"Teaching certification in {subject}, expires: {certification_expiry}"
+        self._info = None
+        self._schedule = set()
     
     @property
     def subject(self): return self._subject
@@ -168,41 +210,39 @@ class Educator(Person, ISchedulable, ICertified):
     
     def display_info(self):
         """Display educator-specific information."""
-        return f"ID: {self._id} | Name: {self._name} | Role: {self._role} | " \
-               f"Subject: {self._subject} | Education: {self._education_level}"
-    
-    def schedule(self, date, time):
-        """Schedule a class."""
-        if self.is_available(date, time):
-            if date not in self._schedule:
-                self._schedule[date] = []
-            self._schedule[date].append(time)
-            return True
-        else:
-            raise ScheduleConflictException(f"{self._name} already has a class at {date} {time}")
-    
-    def is_available(self, date, time):
-        """Check if available for a class."""
-        return date not in self._schedule or time not in self._schedule[date]
+        if self._info is None:
+            self._info = f"ID: {self._id} | Name: {self._name} | Role: {self._role} | " \
+                         f"Subject: {self._subject} | Education: {self._education_level}"
+        return self._info
     
     def verify_certification(self):
         """Verify teaching certification."""
-        return True if self._certification_expiry > "2023-01-01" else False
+        return self._certification_expiry_date > _CERTIFICATION_CUTOFF
     
     def get_certification_details(self):
         """Get certification details."""
-        return f"Teaching certification in {self._subject}, expires: {self._certification_expiry}"
+        return self._certification_details
+
+
+_WEEKEND_SUFFIXES = frozenset(("Sat", "Sun"))
 
 
-class Volunteer(Person, ISchedulable):
+class Volunteer(Person, SchedulableMixin):
     """Class representing volunteers at the youth center."""
     
+    __slots__ = ("_availability", "_hours_completed", "_weekend_ok", "_weekday_ok", "_info", "_schedule")
+    
     def __init__(self, id, name, availability):
         """Initialize a Volunteer with required attributes."""
         super().__init__(id, name, "Volunteer")
         self._availability = availability
         self._hours_completed = 0
-        self._schedule = {}
+        self._info = None
+        self._schedule = set()
+        
+        # Resolve the availability pattern once rather than on every check
+        self._weekend_ok = availability in ("weekends", "all")
+        self._weekday_ok = availability in ("weekdays", "all")
     
     @property
     def availability(self): return self._availability
@@ -212,8 +252,10 @@ class Volunteer(Person, ISchedulable):
     
     @hours_completed.setter
     def hours_completed(self, value):
-        if value >= 0:
-            self._hours_completed = value
+        if value < 0:
+            raise ValueError("Hours completed cannot be negative")
+        self._hours_completed = value
+        self._info = None
     
     def perform_duty(self):
         """Perform volunteer duties."""
@@ -221,152 +263,360 @@ class Volunteer(Person, ISchedulable):
     
     def display_info(self):
         """Display volunteer-specific information."""
-        return f"ID: {self._id} | Name: {self._name} | Role: {self._role} | " \
-               f"Availability: {self._availability} | Hours: {self._hours_completed}"
+        if self._info is None:
+            self._info = f"ID: {self._id} | Name: {self._name} | Role: {self._role} | " \
+                         f"Availability: {self._availability} | Hours: {self._hours_completed}"
+        return self._info
     
     def schedule(self, date, time):
         """Schedule volunteer time."""
-        # Check if already scheduled
-        if date in self._schedule and time in self._schedule[date]:
-            raise ScheduleConflictException(f"{self._name} already has a session at {date} {time}")
-            
-        if self.is_available(date, time):
-            if date not in self._schedule:
-                self._schedule[date] = []
-            self._schedule[date].append(time)
-            return True
-        else:
+        # A booked slot was necessarily available, so checking the pattern first is safe
+        if not self._available_on(date):
             raise ScheduleConflictException(f"{self._name} is not available at {date} {time}")
+        return super().schedule(date, time)
     
     def is_available(self, date, time):
         """Check if available to volunteer."""
-        # Check if already scheduled
-        if date in self._schedule and time in self._schedule[date]:
-            return False
-            
         # Simple availability check based on day of week
-        if self._availability == "weekends" and date.endswith("Sat") or date.endswith("Sun"):
-            return True
-        elif self._availability == "weekdays" and not (date.endswith("Sat") or date.endswith("Sun")):
-            return True
-        elif self._availability == "all":
-            return True
-        else:
-            return False
+        return (date, time) not in self._schedule and self._available_on(date)
+    
+    def _available_on(self, date):
+        """Check the availability pattern against the date's day suffix."""
+        return self._weekend_ok if date[-3:] in _WEEKEND_SUFFIXES else self._weekday_ok
     
     def log_hours(self, hours):
         """Log completed volunteer hours."""
         if hours > 0:
             self._hours_completed += hours
+            self._info = None
             return True
         return False
 
 
+# A single scheduled session of an activity
+Activity = namedtuple("Activity", "date time responsible")
+
+
 class YouthCenter:
     """Class representing the youth center."""
     
     def __init__(self, name):
         """Initialize a YouthCenter with required attributes."""
         self.__name = name
-        self.__personnel = []
+        self.__personnel = {}
+        self.__personnel_by_type = {Counselor: {}, Educator: {}, Volunteer: {}, ICertified: {}}
         self.__activities = {}
-        self.__next_id = 1
+        self.__id_sequences = {}
+        self.__personnel_snapshot = None
+        self.__activities_snapshot = None
     
     @property
     def name(self): return self.__name
     
     @property
-    def personnel(self): return self.__personnel.copy()
+    def personnel(self):
+        # Immutable snapshot, rebuilt only after the roster changes
+        if self.__personnel_snapshot is None:
+            self.__personnel_snapshot = tuple(self.__personnel.values())
+        return self.__personnel_snapshot
     
     @property
-    def activities(self): return self.__activities.copy()
+    def activities(self):
+        # Read-only snapshot, rebuilt only after an activity is created
+        if self.__activities_snapshot is None:
+            self.__activities_snapshot = MappingProxyType(
+                {name: tuple(sessions) for name, sessions in self.__activities.items()})
+        return self.__activities_snapshot
     
     def get_next_id(self, role_prefix):
         """Get next available ID for a new person."""
-        id_val = self.__next_id
-        self.__next_id += 1
-        return f"{role_prefix}{id_val:03d}"
+        # One (counter, formatter) pair per prefix, created on first use
+        sequence = self.__id_sequences.get(role_prefix)
+        if sequence is None:
+            sequence = self.__id_sequences[role_prefix] = (itertools.count(1), f"{role_prefix}{{:03d}}".format)
+        counter, formatter = sequence
+        
+        # Each prefix numbers independently; skip IDs already taken by existing personnel
+        person_id = formatter(next(counter))
+        while person_id in self.__personnel:
+            person_id = formatter(next(counter))
+        return person_id
     
     def add_person(self, person):
         """Add a person to the youth center."""
         # Check if person already exists
-        if any(p.id == person.id for p in self.__personnel):
+        if person.id in self.__personnel:
             return False
         
-        self.__personnel.append(person)
+        self.__personnel[person.id] = person
+        self.__personnel_snapshot = None
+        # Walk the MRO rather than isinstance-checking each bucket through ABCMeta
+        for person_class in type(person).__mro__:
+            bucket = self.__personnel_by_type.get(person_class)
+            if bucket is not None:
+                bucket[person.id] = person
         return True
     
     def remove_person(self, person_id):
         """Remove a person from the youth center."""
-        for i, person in enumerate(self.__personnel):
-            if person.id == person_id:
-                self.__personnel.pop(i)
-                return True
+        if self.__personnel.pop(person_id, None) is None:
+            return False
         
-        return False
+        self.__personnel_snapshot = None
+        for bucket in self.__personnel_by_type.values():
+            bucket.pop(person_id, None)
+        return True
     
     def find_person_by_id(self, person_id):
         """Find a person by ID."""
-        for person in self.__personnel:
-            if person.id == person_id:
-                return person
+        person = self.__personnel.get(person_id)
+        if person is not None:
+            return person
         
         raise PersonNotFoundException(f"Person with ID {person_id} not found")
     
     def get_personnel_by_type(self, person_class):
         """Get all personnel of a specific type."""
-        return [p for p in self.__personnel if isinstance(p, person_class)]
+        bucket = self.__personnel_by_type.get(person_class)
+        if bucket is not None:
+            return list(bucket.values())
+        
+        return [p for p in self.__personnel.values() if isinstance(p, person_class)]
     
     def get_personnel_count(self):
         """Get personnel counts by type."""
         counts = {
-            "Counselor": len(self.get_personnel_by_type(Counselor)),
-            "Educator": len(self.get_personnel_by_type(Educator)),
-            "Volunteer": len(self.get_personnel_by_type(Volunteer))
+            "Counselor": len(self.__personnel_by_type[Counselor]),
+            "Educator": len(self.__personnel_by_type[Educator]),
+            "Volunteer": len(self.__personnel_by_type[Volunteer])
         }
         
         return counts
     
     def create_activity(self, name, date, time, responsible_person_id):
         """Create a new activity at the youth center."""
+        person = self.__personnel.get(responsible_person_id)
+        
+        # Check if person exists and can be scheduled
+        if not getattr(person, "_is_schedulable", False):
+            return False
+        
+        # schedule() checks and books the slot in one lookup; a conflict either raises or returns False
         try:
-            person = self.find_person_by_id(responsible_person_id)
-            
-            # Check if person can be scheduled
-            if isinstance(person, ISchedulable):
-                if person.schedule(date, time):
-                    if name not in self.__activities:
-                        self.__activities[name] = []
-                    
-                    self.__activities[name].append({
-                        "date": date,
-                        "time": time,
-                        "responsible": person.id
-                    })
-                    return True
-            else:
+            if not person.schedule(date, time):
                 return False
-                
-        except (PersonNotFoundException, ScheduleConflictException):
+        except ScheduleConflictException:
             return False
         
-        return False
+        if name not in self.__activities:
+            self.__activities[name] = []
+        
+        self.__activities[name].append(Activity(date, time, person.id))
+        self.__activities_snapshot = None
+        return True
+    
+    def iter_certifications(self):
+        """Yield (id, name, certification_valid, details) for all staff who require certification."""
+        for person in self.__personnel_by_type[ICertified].values():
+            is_valid = person.verify_certification()
+            yield (person.id, person.name, is_valid,
+                   person.get_certification_details() if is_valid else "Certification invalid or expired")
     
     def verify_all_certifications(self):
         """Verify certifications for all staff who require them."""
-        results = []
+        return [
+            {"id": person_id, "name": name, "certification_valid": is_valid, "details": details}
+            for person_id, name, is_valid, details in self.iter_certifications()
+        ]
+
+
+_SPECIALIZATIONS = ("behavioral", "family", "crisis", "youth", "career")
+_SUBJECTS = ("mathematics", "science", "language", "arts", "music")
+_EDUCATION_LEVELS = ("Bachelor's", "Master's", "PhD")
+_AVAILABILITIES = ("weekends", "weekdays", "evenings", "all")
+
+
+def _numbered_menu(title, options):
+    """Build a numbered selection prompt."""
+    return "\n".join([f"\n{title}"] + [f"{i}. {option}" for i, option in enumerate(options, 1)])
+
+
+# Prompts are built once at import rather than on every redraw
+_PERSON_TYPE_MENU = _numbered_menu("Select person type:", ("Counselor", "Educator", "Volunteer"))
+_SPECIALIZATION_MENU = _numbered_menu("Select specialization:", _SPECIALIZATIONS)
+_SUBJECT_MENU = _numbered_menu("Select subject:", _SUBJECTS)
+_EDUCATION_LEVEL_MENU = _numbered_menu("Select education level:", _EDUCATION_LEVELS)
+_AVAILABILITY_MENU = _numbered_menu("Select availability:", _AVAILABILITIES)
+_MAIN_MENU = _numbered_menu("Menu:", ("Add Person", "Schedule Activity", "Display All Personnel",
+                                      "Verify Certifications")) + "\n0. Exit"
+
+
+_ID_PREFIXES = {Counselor: "C", Educator: "E", Volunteer: "V"}
+
+
+def _cmd_add_person(center, spec):
+    """Create the person described by spec, add them to the center and return a status message."""
+    person_type = spec["type"]
+    person_id = center.get_next_id(_ID_PREFIXES[person_type])
+    person = person_type(person_id, spec["name"], *spec.get("args", ()))
+    
+    if center.add_person(person):
+        return f"{person_type.__name__} '{person_id}' added successfully."
+    return f"Person with ID {person_id} already exists."
+
+
+def _cmd_schedule_activity(center, spec):
+    """Schedule the activity described by spec and return a status message."""
+    if center.create_activity(spec["name"], spec["date"], spec["time"], spec["person_id"]):
+        return f"Activity '{spec['name']}' scheduled successfully."
+    return "Failed to schedule activity. Check for schedule conflicts."
+
+
+def _cmd_display_personnel(center, spec):
+    """Return information for all personnel."""
+    return "\n".join(["\nAll Personnel:"] + [person.display_info() for person in center.personnel])
+
+
+def _cmd_verify_certifications(center, spec):
+    """Return certification verification results for all certified staff."""
+    lines = ["\nCertification Verification Results:"]
+    for person_id, name, is_valid, details in center.iter_certifications():
+        lines.append(f"{person_id} | {name} | Status: {'VALID' if is_valid else 'INVALID'}")
+        lines.append(f"  Details: {details}")
+    
+    if len(lines) == 1:
+        return "No certifications to verify."
+    return "\n".join(lines)
+
+
+_COMMANDS = {
+    "add_person": _cmd_add_person,
+    "schedule_activity": _cmd_schedule_activity,
+    "display_personnel": _cmd_display_personnel,
+    "verify_certifications": _cmd_verify_certifications,
+}
+
+
+def handle_command(center, command):
+    """Run a parsed command dict against the center and return its status message without any I/O."""
+    handler = _COMMANDS.get(command.get("command"))
+    if handler is None:
+        raise ValueError(f"Unknown command: {command.get('command')}")
+    return handler(center, command)
+
+
+def _handle_add_person(center):
+    """Prompt for a new person and add them to the youth center."""
+    print(_PERSON_TYPE_MENU)
+    
+    person_type = int(input("Enter choice (1-3): "))
+    if not 1 <= person_type <= 3:
+        raise ValueError("Invalid person type")
+    
+    name = input("Enter name: ")
+    
+    # Gather type-specific attributes
+    try:
+        if person_type == 1:  # Counselor
+            print(_SPECIALIZATION_MENU)
+            
+            spec_choice = int(input("Enter choice (1-5): "))
+            if 1 <= spec_choice <= len(_SPECIALIZATIONS):
+                specialization = _SPECIALIZATIONS[spec_choice-1]
+            else:
+                raise ValueError("Invalid specialization")
+                
+            case_load = int(input(f"Enter current case load (0-{Counselor._MAX_CASE_LOAD}): "))
+            if not (0 <= case_load <= Counselor._MAX_CASE_LOAD):
+                raise ValueError(f"Case load must be between 0 and {Counselor._MAX_CASE_LOAD}")
+                
+            command = {"type": Counselor, "args": (specialization, case_load)}
         
-        for person in self.__personnel:
-            if isinstance(person, ICertified):
-                is_valid = person.verify_certification()
-                results.append({
-                    "id": person.id,
-                    "name": person.name,
-                    "certification_valid": is_valid,
-                    "details": person.get_certification_details() if is_valid else "Certification invalid or expired"
-                })
+        elif person_type == 2:  # Educator
+            print(_SUBJECT_MENU)
+            
+            subj_choice = int(input("Enter choice (1-5): "))
+            if 1 <= subj_choice <= len(_SUBJECTS):
+                subject = _SUBJECTS[subj_choice-1]
+            else:
+                raise ValueError("Invalid subject")
+                
+            print(_EDUCATION_LEVEL_MENU)
+            
+            level_choice = int(input("Enter choice (1-3): "))
+            if 1 <= level_choice <= len(_EDUCATION_LEVELS):
+                education_level = _EDUCATION_LEVELS[level_choice-1]
+            else:
+                raise ValueError("Invalid education level")
+                
+            command = {"type": Educator, "args": (subject, education_level)}
         
-        return results
+        else:  # Volunteer
+            print(_AVAILABILITY_MENU)
+            
+            avail_choice = int(input("Enter choice (1-4): "))
+            if 1 <= avail_choice <= len(_AVAILABILITIES):
+                availability = _AVAILABILITIES[avail_choice-1]
+            else:
+                raise ValueError("Invalid availability")
+                
+            command = {"type": Volunteer, "args": (availability,)}
+        
+        command.update(command="add_person", name=name)
+        print(handle_command(center, command))
+    
+    except Exception as e:
+        print(f"Error adding person: {e}")
+
+
+def _handle_schedule_activity(center):
+    """Prompt for an activity and schedule it with a selected person."""
+    try:
+        personnel = center.personnel
+        
+        # Display personnel
+        print("\nAvailable Personnel:")
+        for i, person in enumerate(personnel, 1):
+            print(f"{i}. {person.id} - {person.name} ({person.role})")
+        
+        person_index = int(input("\nSelect person (by number): ")) - 1
+        if 0 <= person_index < len(personnel):
+            selected_person = personnel[person_index]
+            
+            if not getattr(selected_person, "_is_schedulable", False):
+                print(f"Error: {selected_person.name} cannot be scheduled.")
+                return
+            
+            print(handle_command(center, {
+                "command": "schedule_activity",
+                "name": input("Enter activity name: "),
+                "date": input("Enter date (e.g., 2023-06-15): "),
+                "time": input("Enter time (e.g., 14:00): "),
+                "person_id": selected_person.id,
+            }))
+        else:
+            print("Invalid selection.")
+    
+    except Exception as e:
+        print(f"Error scheduling activity: {e}")
+
+
+_MENU_ACTIONS = {
+    1: _handle_add_person,
+    2: _handle_schedule_activity,
+    3: lambda center: print(handle_command(center, {"command": "display_personnel"})),
+    4: lambda center: print(handle_command(center, {"command": "verify_certifications"})),
+}
+
+_INITIAL_PERSONNEL = (
+    # Counselors
+    (Counselor, ("C001", "Emma Smith", "behavioral", 5)),
+    (Counselor, ("C002", "Michael Jones", "family", 3)),
+    # Educators
+    (Educator, ("E001", "John Davis", "mathematics")),
+    # Volunteers
+    (Volunteer, ("V001", "Sara Johnson", "weekends")),
+)
 
 
 def main():
@@ -376,15 +626,8 @@ def main():
     
     # Add initial personnel
     try:
-        # Counselors
-        center.add_person(Counselor("C001", "Emma Smith", "behavioral", 5))
-        center.add_person(Counselor("C002", "Michael Jones", "family", 3))
-        
-        # Educators
-        center.add_person(Educator("E001", "John Davis", "mathematics"))
-        
-        # Volunteers
-        center.add_person(Volunteer("V001", "Sara Johnson", "weekends"))
+        for person_class, args in _INITIAL_PERSONNEL:
+            center.add_person(person_class(*args))
     except Exception as e:
         print(f"Error setting up youth center: {e}")
     
@@ -398,158 +641,18 @@ def main():
         for role, count in counts.items():
             print(f"  {role}s: {count}")
         
-        print("\nMenu:")
-        print("1. Add Person")
-        print("2. Schedule Activity")
-        print("3. Display All Personnel")
-        print("4. Verify Certifications")
-        print("0. Exit")
+        print(_MAIN_MENU)
         
         try:
             choice = int(input("\nEnter your choice (0-4): "))
             
-            if choice == 1:
-                print("\nSelect person type:")
-                print("1. Counselor")
-                print("2. Educator")
-                print("3. Volunteer")
-                
-                person_type = int(input("Enter choice (1-3): "))
-                
-                # Common attributes
-                if person_type == 1:
-                    id_prefix = "C"
-                    type_name = "Counselor"
-                elif person_type == 2:
-                    id_prefix = "E"
-                    type_name = "Educator"
-                elif person_type == 3:
-                    id_prefix = "V"
-                    type_name = "Volunteer"
-                else:
-                    raise ValueError("Invalid person type")
-                
-                person_id = center.get_next_id(id_prefix)
-                name = input("Enter name: ")
-                
-                # Create person based on type
-                try:
-                    if person_type == 1:  # Counselor
-                        specializations = ["behavioral", "family", "crisis", "youth", "career"]
-                        print("\nSelect specialization:")
-                        for i, spec in enumerate(specializations, 1):
-                            print(f"{i}. {spec}")
-                        
-                        spec_choice = int(input("Enter choice (1-5): "))
-                        if 1 <= spec_choice <= len(specializations):
-                            specialization = specializations[spec_choice-1]
-                        else:
-                            raise ValueError("Invalid specialization")
-                            
-                        case_load = int(input("Enter current case load (0-20): "))
-                        if not (0 <= case_load <= 20):
-                            raise ValueError("Case load must be between 0 and 20")
-                            
-                        person = Counselor(person_id, name, specialization, case_load)
-                    
-                    elif person_type == 2:  # Educator
-                        subjects = ["mathematics", "science", "language", "arts", "music"]
-                        print("\nSelect subject:")
-                        for i, subj in enumerate(subjects, 1):
-                            print(f"{i}. {subj}")
-                        
-                        subj_choice = int(input("Enter choice (1-5): "))
-                        if 1 <= subj_choice <= len(subjects):
-                            subject = subjects[subj_choice-1]
-                        else:
-                            raise ValueError("Invalid subject")
-                            
-                        education_levels = ["Bachelor's", "Master's", "PhD"]
-                        print("\nSelect education level:")
-                        for i, level in enumerate(education_levels, 1):
-                            print(f"{i}. {level}")
-                        
-                        level_choice = int(input("Enter choice (1-3): "))
-                        if 1 <= level_choice <= len(education_levels):
-                            education_level = education_levels[level_choice-1]
-                        else:
-                            raise ValueError("Invalid education level")
-                            
-                        person = Educator(person_id, name, subject, education_level)
-                    
-                    elif person_type == 3:  # Volunteer
-                        availabilities = ["weekends", "weekdays", "evenings", "all"]
-                        print("\nSelect availability:")
-                        for i, avail in enumerate(availabilities, 1):
-                            print(f"{i}. {avail}")
-                        
-                        avail_choice = int(input("Enter choice (1-4): "))
-                        if 1 <= avail_choice <= len(availabilities):
-                            availability = availabilities[avail_choice-1]
-                        else:
-                            raise ValueError("Invalid availability")
-                            
-                        person = Volunteer(person_id, name, availability)
-                    
-                    # Add to youth center
-                    if center.add_person(person):
-                        print(f"{type_name} '{person_id}' added successfully.")
-                    else:
-                        print(f"Person with ID {person_id} already exists.")
-                
-                except Exception as e:
-                    print(f"Error adding person: {e}")
-            
-            elif choice == 2:
-                try:
-                    # Display personnel
-                    print("\nAvailable Personnel:")
-                    for i, person in enumerate(center.personnel, 1):
-                        print(f"{i}. {person.id} - {person.name} ({person.role})")
-                    
-                    person_index = int(input("\nSelect person (by number): ")) - 1
-                    if 0 <= person_index < len(center.personnel):
-                        selected_person = center.personnel[person_index]
-                        
-                        if not isinstance(selected_person, ISchedulable):
-                            print(f"Error: {selected_person.name} cannot be scheduled.")
-                            continue
-                        
-                        activity_name = input("Enter activity name: ")
-                        activity_date = input("Enter date (e.g., 2023-06-15): ")
-                        activity_time = input("Enter time (e.g., 14:00): ")
-                        
-                        if center.create_activity(activity_name, activity_date, activity_time, selected_person.id):
-                            print(f"Activity '{activity_name}' scheduled successfully.")
-                        else:
-                            print("Failed to schedule activity. Check for schedule conflicts.")
-                    else:
-                        print("Invalid selection.")
-                
-                except Exception as e:
-                    print(f"Error scheduling activity: {e}")
-            
-            elif choice == 3:
-                print("\nAll Personnel:")
-                for person in center.personnel:
-                    print(person.display_info())
-            
-            elif choice == 4:
-                results = center.verify_all_certifications()
-                
-                if results:
-                    print("\nCertification Verification Results:")
-                    for result in results:
-                        status = "VALID" if result["certification_valid"] else "INVALID"
-                        print(f"{result['id']} | {result['name']} | Status: {status}")
-                        print(f"  Details: {result['details']}")
-                else:
-                    print("No certifications to verify.")
-            
-            elif choice == 0:
+            if choice == 0:
                 print("Thank you for using the Youth Center Management System.")
                 break
             
+            action = _MENU_ACTIONS.get(choice)
+            if action is not None:
+                action(center)
             else:
                 print("Invalid choice. Please enter a number between 0 and 4.")
         